@@ -1,18 +1,29 @@
+import logging
+import random
+from dataclasses import dataclass, field
+
+import numpy as np
 import traci
+import traci.constants as tc
 import sumolib
-import time
-import random
+
+logger = logging.getLogger(__name__)
 
 # Configuration
 SUMO_BINARY = "sumo-gui"  # or "sumo" for CLI
 CONFIG_FILE = "sumo/map.sumocfg"
+GUI_DELAY_MS = 100  # Step delay applied by sumo-gui itself; headless runs are not throttled
 AMBULANCE_IDS = ["ambulance_1", "ambulance_2"]  # List of ambulance IDs
+AMBULANCE_IDS_SET = frozenset(AMBULANCE_IDS)
 JUNCTIONS = ["J1", "J2", "J3", "J4", "J5", "J6"]
+JUNCTIONS_SET = frozenset(JUNCTIONS)  # For membership tests; JUNCTIONS keeps the order
+J_IDX = {j: i for i, j in enumerate(JUNCTIONS)}  # Junction -> row/column in the arrays below
 
 # Timing tracking
 AMBULANCE_START_TIMES = {}  # Track when each ambulance starts
 AMBULANCE_END_TIMES = {}    # Track when each ambulance finishes
 PREEMPTION_ENABLED = True   # Toggle for signal preemption
+QUIET_LOGGING = False       # Suppress per-link priority messages for timed/benchmark runs
 
 # Emergency codes configuration
 AMBULANCE_PRIORITIES = {
@@ -23,124 +34,134 @@ AMBULANCE_PRIORITIES = {
 # Pheromone configuration
 PHEROMONE_DECAY = 0.95
 PHEROMONE_DEPOSIT = 1.0
+PHEROMONE = np.ones((len(JUNCTIONS), len(JUNCTIONS)))  # Pheromone on each junction -> junction move
+TRAFFIC = np.zeros(len(JUNCTIONS), dtype=np.int32)     # Vehicles around each junction
 
-class Junction:
-    def __init__(self, id):
-        self.id = id
-        self.pheromone = {}  # Stores pheromone values to neighboring junctions
-        self.traffic_level = 0
-    
-    def update_traffic_level(self):
-        # Get number of vehicles around this junction
-        incoming_edges = traci.trafficlight.getControlledLinks(self.id)
+# Variables fetched once per step through TraCI subscriptions
+VEHICLE_VARS = [tc.VAR_ROAD_ID, tc.VAR_EDGES, tc.VAR_ROUTE_INDEX, tc.VAR_NEXT_TLS]
+EDGE_VARS = [tc.LAST_STEP_VEHICLE_NUMBER]
+
+# Static network topology, filled once by init_topology() and kept across runs
+_TOPOLOGY_INITIALIZED = False
+CONTROLLED_LINKS = {}  # Junction -> controlled links as returned by TraCI
+INCOMING_EDGES = {}    # Junction -> incoming edge ID per controlled link (lane index removed)
+LINK_INDEX = {}        # Junction -> (from_edge, to_edge) per link index, None if unused
+EDGE_BASE = {}         # Edge or lane ID -> edge ID without lane index
+EDGE_TO_JUNCTION = {}  # Edge ID -> tracked junction the edge leads into
+EDGE_PREFIX_TO_JUNCTION = {}  # Edge ID -> tracked junction the edge starts from
+FROM_EDGE_TO_LINKIDX = {}    # Junction -> incoming edge ID -> link indices leaving that edge
+LINKIDX_TO_TO_JUNCTION = {}  # Junction -> tracked junction each link leads to, None if none
+STATE_TEMPLATE = {}          # Junction -> all-red signal state as a mutable byte buffer
+GREEN = ord('G')
+NEXT_JUNCTION_IDX = []       # Junction index -> tuple of indices of the junctions it leads to
+
+# Signal state last sent to each junction during the current run
+LAST_TL_STATE = {}
+
+@dataclass
+class Route:
+    """Planned junction sequence with constant-time position and membership lookups"""
+    seq: list
+    idx: dict = field(init=False)
+    prefixes: frozenset = field(init=False)
+
+    def __post_init__(self):
+        self.idx = {j: i for i, j in enumerate(self.seq)}
+        self.prefixes = frozenset(self.seq)
+
+EMPTY_ROUTE = Route([])
+
+def update_traffic_levels(edge_data):
+    """Count the vehicles around each junction from the edge subscriptions"""
+    for junction in JUNCTIONS:
         vehicle_count = 0
-        for links in incoming_edges:
-            if links:
-                edge_id = links[0][0].split('_')[0]  # Remove lane index
-                try:
-                    vehicle_count += traci.edge.getLastStepVehicleNumber(edge_id)
-                except traci.exceptions.TraCIException:
-                    # Try with lane index
-                    try:
-                        vehicle_count += traci.edge.getLastStepVehicleNumber(edge_id + "_0")
-                    except:
-                        pass
-        self.traffic_level = vehicle_count
-        
-    def update_pheromone(self, next_junction, value):
-        if next_junction not in self.pheromone:
-            self.pheromone[next_junction] = 0
-        self.pheromone[next_junction] = (self.pheromone[next_junction] * PHEROMONE_DECAY) + value
+        for edge_id in INCOMING_EDGES[junction]:
+            if edge_id in edge_data:
+                vehicle_count += edge_data[edge_id][tc.LAST_STEP_VEHICLE_NUMBER]
+        TRAFFIC[J_IDX[junction]] = vehicle_count
 
 def get_next_junctions(current_junction):
-    """Get list of possible next junctions based on network topology"""
-    controlled_links = traci.trafficlight.getControlledLinks(current_junction)
+    """Get possible next junctions based on network topology"""
     next_junctions = set()
-    for links in controlled_links:
-        if links:
-            to_edge = links[0][1]
-            for junction in JUNCTIONS:
-                if junction != current_junction and to_edge.endswith(junction):
-                    next_junctions.add(junction)
+    for link in LINK_INDEX[current_junction]:
+        if link:
+            junction = EDGE_TO_JUNCTION.get(link[1])
+            if junction and junction != current_junction:
+                next_junctions.add(junction)
     return list(next_junctions)
 
-def calculate_route_score(from_junction, to_junction, junctions):
-    """Calculate score for moving from one junction to another"""
-    if to_junction not in junctions[from_junction].pheromone:
-        junctions[from_junction].pheromone[to_junction] = 1.0
-        
-    pheromone = junctions[from_junction].pheromone[to_junction]
-    traffic = junctions[to_junction].traffic_level + 1  # Add 1 to avoid division by zero
-    
-    return (pheromone ** 2) / traffic  # Give more weight to pheromone
-
-def get_ambulance_route_info(ambulance_id):
+def get_ambulance_route_info(ambulance_id, vehicle_data):
     """Get ambulance's current and next edge information"""
-    if ambulance_id not in traci.vehicle.getIDList():
+    if ambulance_id not in vehicle_data:
         return None, None
     
-    current_edge = traci.vehicle.getRoadID(ambulance_id)
-    if current_edge.endswith("_0"):
-        current_edge = current_edge[:-2]
+    values = vehicle_data[ambulance_id]
+    current_edge = values[tc.VAR_ROAD_ID]
+    current_edge = EDGE_BASE.get(current_edge, current_edge)
     
-    route = traci.vehicle.getRoute(ambulance_id)
-    route_index = traci.vehicle.getRouteIndex(ambulance_id)
+    route = values[tc.VAR_EDGES]
+    route_index = values[tc.VAR_ROUTE_INDEX]
     next_edge = route[route_index + 1] if route_index < len(route) - 1 else None
-    if next_edge and next_edge.endswith("_0"):
-        next_edge = next_edge[:-2]
+    if next_edge:
+        next_edge = EDGE_BASE.get(next_edge, next_edge)
     
     return current_edge, next_edge
 
-def find_best_route(current_junction, junctions):
+def find_best_route(current_junction):
     """Find best route from current junction using ACO principles"""
-    if current_junction not in JUNCTIONS:
-        return []
+    if current_junction not in JUNCTIONS_SET:
+        return EMPTY_ROUTE
         
+    # Plain Python floats are much cheaper to do scalar arithmetic on than NumPy elements
+    pheromone = PHEROMONE.tolist()
+    traffic = TRAFFIC.tolist()
+    
+    current = J_IDX[current_junction]
+    visited = 1 << current  # Bitmask of visited junction indices
     route = [current_junction]
-    current = current_junction
-    visited = {current}
     
     while len(route) < len(JUNCTIONS):
-        next_possible = get_next_junctions(current)
-        next_possible = [j for j in next_possible if j not in visited]
+        next_possible = [j for j in NEXT_JUNCTION_IDX[current] if not visited & (1 << j)]
         
         if not next_possible:
             break
             
-        # Calculate scores for each possible next junction
-        scores = [calculate_route_score(current, next_j, junctions) for next_j in next_possible]
-        total_score = sum(scores)
-        if total_score == 0:
-            probabilities = [1/len(scores)] * len(scores)
-        else:
-            probabilities = [s/total_score for s in scores]
+        # Build cumulative scores; square pheromone to give it more weight and
+        # add 1 to traffic to avoid division by zero
+        cumulative = []
+        total_score = 0.0
+        for j in next_possible:
+            total_score += pheromone[current][j] ** 2 / (traffic[j] + 1)
+            cumulative.append(total_score)
             
-        # Choose next junction based on probabilities
-        next_junction = random.choices(next_possible, probabilities)[0]
-        route.append(next_junction)
-        visited.add(next_junction)
-        current = next_junction
+        # Choose next junction based on its score (uniform if all scores are zero)
+        if total_score > 0:
+            current = random.choices(next_possible, cum_weights=cumulative)[0]
+        else:
+            current = random.choice(next_possible)
+        route.append(JUNCTIONS[current])
+        visited |= 1 << current
         
-    return route
+    return Route(route)
 
-def set_signals_for_ambulance(green_junction, routes):
+def set_signals_for_ambulance(green_junction, routes, route_info):
     """Set traffic signals considering ambulance's route and emergency code priority"""
     global PREEMPTION_ENABLED
     if not PREEMPTION_ENABLED:
         return
+    if green_junction not in LINK_INDEX:
+        return  # Only tracked junctions have cached link tables
         
-    # Get junction's controlled links and current state
-    controlled_links = traci.trafficlight.getControlledLinks(green_junction)
-    current_state = list(traci.trafficlight.getRedYellowGreenState(green_junction))
-    
-    # Initialize all states to red
-    for i in range(len(current_state)):
-        current_state[i] = 'r'
+    # Get junction's link tables and start with all states red
+    controlled_links = LINK_INDEX[green_junction]
+    link_indices = FROM_EDGE_TO_LINKIDX[green_junction]
+    link_targets = LINKIDX_TO_TO_JUNCTION[green_junction]
+    current_state = STATE_TEMPLATE[green_junction][:]
     
     # Get ambulances approaching this junction and sort by priority code
     approaching_ambulances = []
     for ambulance_id in AMBULANCE_IDS:
-        current_edge, next_edge = get_ambulance_route_info(ambulance_id)
+        current_edge, next_edge = route_info.get(ambulance_id, (None, None))
         if current_edge and next_edge:
             approaching_ambulances.append(ambulance_id)
     
@@ -154,44 +175,100 @@ def set_signals_for_ambulance(green_junction, routes):
     
     # Process each ambulance in priority order
     for ambulance_id in approaching_ambulances:
-        current_edge, next_edge = get_ambulance_route_info(ambulance_id)
-        if not current_edge or not next_edge:
-            continue
+        current_edge, next_edge = route_info[ambulance_id]
 
         # Get this ambulance's route
-        route = routes.get(ambulance_id, [])
-        current_route_index = route.index(green_junction) if green_junction in route else -1
-        next_junction = route[current_route_index + 1] if current_route_index >= 0 and current_route_index < len(route) - 1 else None
+        route = routes.get(ambulance_id, EMPTY_ROUTE)
+        current_route_index = route.idx.get(green_junction, -1)
+        next_junction = route.seq[current_route_index + 1] if current_route_index >= 0 and current_route_index < len(route.seq) - 1 else None
         
         # Update state for all directions from ambulance's current road
-        for i, links in enumerate(controlled_links):
-            if not links:
-                continue
-                
-            from_edge, to_edge, _ = links[0]
-            # Remove lane indices for comparison
-            from_edge_base = from_edge.split('_')[0]
-            to_edge_base = to_edge.split('_')[0]
-            
-            # Check if this link starts from ambulance's current road
-            direction_key = (from_edge_base, to_edge_base)
-            if current_edge == from_edge_base and direction_key not in processed_directions:
-                if next_junction and (to_edge_base.endswith(next_junction) or 
-                                    any(to_edge_base.startswith(j) for j in route)):
-                    current_state[i] = 'G'  # Set green for route to next junction
+        for i in link_indices.get(current_edge, ()):
+            direction_key = controlled_links[i]
+            if direction_key not in processed_directions:
+                if next_junction and (link_targets[i] == next_junction or
+                                    EDGE_PREFIX_TO_JUNCTION.get(direction_key[1]) in route.prefixes):
+                    current_state[i] = GREEN  # Set green for route to next junction
                     processed_directions.add(direction_key)
-                    print(f"Priority given to {ambulance_id} ({AMBULANCE_PRIORITIES[ambulance_id]}) at junction {green_junction}")
+                    logger.info("Priority given to %s (%s) at junction %s",
+                                ambulance_id, AMBULANCE_PRIORITIES[ambulance_id], green_junction)
                 elif not next_junction:
-                    current_state[i] = 'G'  # If no next junction known, set all directions green
+                    current_state[i] = GREEN  # If no next junction known, set all directions green
                     processed_directions.add(direction_key)
     
-    # Apply the new state
-    new_state = ''.join(current_state)
-    traci.trafficlight.setRedYellowGreenState(green_junction, new_state)
+    # Apply the new state unless the junction is already showing it
+    if LAST_TL_STATE.get(green_junction) == current_state:
+        return
+    LAST_TL_STATE[green_junction] = bytes(current_state)
+    traci.trafficlight.setRedYellowGreenState(green_junction, current_state.decode('ascii'))
 
-# Function to format time duration
-def format_time(seconds):
-    return f"{seconds:.2f} seconds"
+def init_topology():
+    """Query the static controlled-link topology once and derive the lookup tables"""
+    global _TOPOLOGY_INITIALIZED
+    CONTROLLED_LINKS.clear()
+    INCOMING_EDGES.clear()
+    LINK_INDEX.clear()
+    EDGE_BASE.clear()
+    EDGE_TO_JUNCTION.clear()
+    EDGE_PREFIX_TO_JUNCTION.clear()
+    FROM_EDGE_TO_LINKIDX.clear()
+    LINKIDX_TO_TO_JUNCTION.clear()
+    STATE_TEMPLATE.clear()
+    for junction in JUNCTIONS:
+        CONTROLLED_LINKS[junction] = traci.trafficlight.getControlledLinks(junction)
+        link_index = []
+        incoming_edges = []
+        from_edge_to_linkidx = {}
+        link_targets = []
+        for i, links in enumerate(CONTROLLED_LINKS[junction]):
+            if not links:
+                link_index.append(None)
+                link_targets.append(None)
+                continue
+            # Remove lane indices once instead of on every lookup
+            for lane in links[0][:2]:
+                if lane not in EDGE_BASE:
+                    EDGE_BASE[lane] = lane.split('_')[0]
+                    EDGE_BASE[EDGE_BASE[lane]] = EDGE_BASE[lane]
+            from_edge_base = EDGE_BASE[links[0][0]]
+            to_edge_base = EDGE_BASE[links[0][1]]
+            link_index.append((from_edge_base, to_edge_base))
+            incoming_edges.append(from_edge_base)
+            for edge_base in (from_edge_base, to_edge_base):
+                for target in JUNCTIONS:
+                    if edge_base.endswith(target):
+                        EDGE_TO_JUNCTION[edge_base] = target
+                    if edge_base.startswith(target):
+                        EDGE_PREFIX_TO_JUNCTION[edge_base] = target
+            from_edge_to_linkidx.setdefault(from_edge_base, []).append(i)
+            link_targets.append(EDGE_TO_JUNCTION.get(to_edge_base))
+        LINK_INDEX[junction] = link_index
+        INCOMING_EDGES[junction] = incoming_edges
+        FROM_EDGE_TO_LINKIDX[junction] = from_edge_to_linkidx
+        LINKIDX_TO_TO_JUNCTION[junction] = link_targets
+        STATE_TEMPLATE[junction] = bytearray(b'r') * len(link_index)
+    
+    NEXT_JUNCTION_IDX[:] = [tuple(sorted(J_IDX[j] for j in get_next_junctions(junction)))
+                            for junction in JUNCTIONS]
+    _TOPOLOGY_INITIALIZED = True
+
+def subscribe_network():
+    """Subscribe to everything the control loop reads so each step needs one round-trip per object"""
+    traci.simulation.subscribe([tc.VAR_DEPARTED_VEHICLES_IDS])
+    for junction in JUNCTIONS:
+        for edge_id in set(INCOMING_EDGES[junction]):
+            try:
+                traci.edge.subscribe(edge_id, EDGE_VARS)
+            except traci.exceptions.TraCIException:
+                # Not a plain edge ID; its vehicles are left out of the traffic level
+                pass
+
+def subscribe_departed_ambulances():
+    """Subscribe to ambulances that entered the network during the last step"""
+    departed = traci.simulation.getSubscriptionResults()[tc.VAR_DEPARTED_VEHICLES_IDS]
+    for vehicle_id in departed:
+        if vehicle_id in AMBULANCE_IDS_SET:
+            traci.vehicle.subscribe(vehicle_id, VEHICLE_VARS)
 
 # Global variables for simulation state
 last_junctions = {}  # Track last junction for each ambulance
@@ -199,9 +276,24 @@ current_routes = {}  # Track current route for each ambulance
 
 # Main simulation loop
 if __name__ == "__main__":
+    import atexit
+    import queue
     import subprocess
     import os
+    import sys
     from datetime import datetime, timedelta
+    from logging.handlers import QueueHandler, QueueListener
+    
+    # Write log output from a background thread so the simulation loop never blocks on stdout
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)])
+    # Run progress and results are logged at WARNING so quiet mode only drops the
+    # INFO-level priority messages from the signal-setting hot path
+    if QUIET_LOGGING:
+        logging.disable(logging.INFO)
+    log_listener.start()
+    atexit.register(log_listener.stop)
     
     def run_simulation(preemption_enabled=True):
         global PREEMPTION_ENABLED, last_junctions, current_routes
@@ -210,30 +302,40 @@ if __name__ == "__main__":
         AMBULANCE_END_TIMES.clear()
         last_junctions.clear()
         current_routes.clear()
+        LAST_TL_STATE.clear()
         
-        print(f"\nStarting simulation with signal preemption {'enabled' if preemption_enabled else 'disabled'}...")
+        logger.warning("\nStarting simulation with signal preemption %s...", 'enabled' if preemption_enabled else 'disabled')
         sumo_cmd = [SUMO_BINARY, "-c", CONFIG_FILE]
+        if SUMO_BINARY.endswith("-gui"):
+            sumo_cmd += ["--delay", str(GUI_DELAY_MS)]
         traci.start(sumo_cmd)
         
         # Initialize simulation variables
         step = 0
         simulation_time = 0
         ambulance_active = False
-        junctions = {j_id: Junction(j_id) for j_id in JUNCTIONS}
+        # Start each policy from the same pheromone so the runs stay comparable
+        PHEROMONE.fill(1.0)
+        TRAFFIC.fill(0)
         active_ambulances = set()
         
         try:
+            if not _TOPOLOGY_INITIALIZED:
+                init_topology()
+            subscribe_network()
+            
             while traci.simulation.getMinExpectedNumber() > 0:
                 traci.simulationStep()
                 step += 1
                 simulation_time = traci.simulation.getTime()
                 
-                # Update traffic levels
-                for junction in junctions.values():
-                    junction.update_traffic_level()
+                # Fetch this step's subscribed values
+                subscribe_departed_ambulances()
+                vehicle_data = traci.vehicle.getAllSubscriptionResults()
+                edge_data = traci.edge.getAllSubscriptionResults()
                 
                 # Get current ambulances and track their times
-                current_ambulances = set(aid for aid in AMBULANCE_IDS if aid in traci.vehicle.getIDList())
+                current_ambulances = vehicle_data.keys() & AMBULANCE_IDS_SET
                 
                 if current_ambulances:
                     ambulance_active = True
@@ -241,24 +343,31 @@ if __name__ == "__main__":
                     # Check for new ambulances
                     for ambulance_id in current_ambulances - active_ambulances:
                         AMBULANCE_START_TIMES[ambulance_id] = simulation_time
-                        print(f"\n🚑 Ambulance {ambulance_id} started at {format_time(simulation_time)}")
+                        logger.warning("\n🚑 Ambulance %s started at %.2f seconds", ambulance_id, simulation_time)
                         active_ambulances.add(ambulance_id)
-                        current_routes[ambulance_id] = []
+                        current_routes[ambulance_id] = EMPTY_ROUTE
                         last_junctions[ambulance_id] = None
                     
-                    # Process each ambulance
+                    # Find ambulances that are now heading to a different junction
+                    transitions = []
                     for ambulance_id in current_ambulances:
+                        tls_list = vehicle_data[ambulance_id][tc.VAR_NEXT_TLS]
+                        if tls_list and tls_list[0][0] != last_junctions.get(ambulance_id):
+                            transitions.append((ambulance_id, tls_list[0][0]))
+                    
+                    if transitions:
+                        # Traffic levels and edge information are only consumed at junction
+                        # transitions, so skip them on steps where no ambulance changed junction
+                        update_traffic_levels(edge_data)
+                        route_info = {aid: get_ambulance_route_info(aid, vehicle_data) for aid in current_ambulances}
+                    
+                    # Process each ambulance that reached a new junction
+                    for ambulance_id, current_junction in transitions:
                         try:
-                            tls_list = traci.vehicle.getNextTLS(ambulance_id)
-                            last_junction = last_junctions.get(ambulance_id)
-                            
-                            if tls_list:
-                                current_junction = tls_list[0][0]
-                                if current_junction != last_junction:
-                                    if current_junction in JUNCTIONS:
-                                        current_routes[ambulance_id] = find_best_route(current_junction, junctions)
-                                    set_signals_for_ambulance(current_junction, current_routes)
-                                    last_junctions[ambulance_id] = current_junction
+                            if current_junction in JUNCTIONS_SET:
+                                current_routes[ambulance_id] = find_best_route(current_junction)
+                            set_signals_for_ambulance(current_junction, current_routes, route_info)
+                            last_junctions[ambulance_id] = current_junction
                         except traci.exceptions.TraCIException:
                             continue
                     
@@ -266,59 +375,58 @@ if __name__ == "__main__":
                     for ambulance_id in active_ambulances - current_ambulances:
                         AMBULANCE_END_TIMES[ambulance_id] = simulation_time
                         travel_time = simulation_time - AMBULANCE_START_TIMES[ambulance_id]
-                        print(f"\n{'='*50}")
-                        print(f"🏁 AMBULANCE {ambulance_id} FINISHED")
-                        print(f"⏰ Finish time: {format_time(simulation_time)}")
-                        print(f"📊 Total travel time: {format_time(travel_time)}")
-                        print(f"🚨 Priority level: {AMBULANCE_PRIORITIES[ambulance_id]}")
-                        print(f"{'='*50}")
+                        logger.warning("\n" + "=" * 50)
+                        logger.warning("🏁 AMBULANCE %s FINISHED", ambulance_id)
+                        logger.warning("⏰ Finish time: %.2f seconds", simulation_time)
+                        logger.warning("📊 Total travel time: %.2f seconds", travel_time)
+                        logger.warning("🚨 Priority level: %s", AMBULANCE_PRIORITIES[ambulance_id])
+                        logger.warning("=" * 50)
                         active_ambulances.remove(ambulance_id)
                 
                 elif ambulance_active:
                     # Reset all signals when no ambulances are present
                     for junction in JUNCTIONS:
                         traci.trafficlight.setProgram(junction, "0")
+                    LAST_TL_STATE.clear()
                     ambulance_active = False
                     last_junctions.clear()
                     current_routes.clear()
                 
-                time.sleep(0.1)  # For simulation stability
-                
         except Exception as e:
-            print(f"Simulation error: {e}")
+            logger.error("Simulation error: %s", e)
         finally:
-            print("\n📊 FINAL RESULTS SUMMARY")
-            print("="*50)
+            logger.warning("\n📊 FINAL RESULTS SUMMARY")
+            logger.warning("=" * 50)
             for ambulance_id in AMBULANCE_IDS:
                 if ambulance_id in AMBULANCE_START_TIMES and ambulance_id in AMBULANCE_END_TIMES:
                     travel_time = AMBULANCE_END_TIMES[ambulance_id] - AMBULANCE_START_TIMES[ambulance_id]
-                    print(f"\n🚑 AMBULANCE {ambulance_id}:")
-                    print(f"  🏁 Start time: {format_time(AMBULANCE_START_TIMES[ambulance_id])}")
-                    print(f"  ⏰ Finish time: {format_time(AMBULANCE_END_TIMES[ambulance_id])}")
-                    print(f"  ⌛ Total travel time: {format_time(travel_time)}")
-                    print(f"  🚨 Priority: {AMBULANCE_PRIORITIES[ambulance_id]}")
-            print("="*50)
+                    logger.warning("\n🚑 AMBULANCE %s:", ambulance_id)
+                    logger.warning("  🏁 Start time: %.2f seconds", AMBULANCE_START_TIMES[ambulance_id])
+                    logger.warning("  ⏰ Finish time: %.2f seconds", AMBULANCE_END_TIMES[ambulance_id])
+                    logger.warning("  ⌛ Total travel time: %.2f seconds", travel_time)
+                    logger.warning("  🚨 Priority: %s", AMBULANCE_PRIORITIES[ambulance_id])
+            logger.warning("=" * 50)
             traci.close()
         
         return AMBULANCE_START_TIMES.copy(), AMBULANCE_END_TIMES.copy()
     
     # Run simulation with and without preemption
-    print("\n🚦 Running simulation with signal preemption...")
+    logger.warning("\n🚦 Running simulation with signal preemption...")
     start_times_with, end_times_with = run_simulation(True)
     
-    print("\n🚦 Running simulation without signal preemption...")
+    logger.warning("\n🚦 Running simulation without signal preemption...")
     start_times_without, end_times_without = run_simulation(False)
     
     # Compare results
-    print("\n📊 Comparison Results:")
+    logger.warning("\n📊 Comparison Results:")
     for ambulance_id in AMBULANCE_IDS:
         if (ambulance_id in start_times_with and ambulance_id in end_times_with and
             ambulance_id in start_times_without and ambulance_id in end_times_without):
             time_with = end_times_with[ambulance_id] - start_times_with[ambulance_id]
             time_without = end_times_without[ambulance_id] - start_times_without[ambulance_id]
             time_saved = time_without - time_with
-            print(f"\nAmbulance {ambulance_id} ({AMBULANCE_PRIORITIES[ambulance_id]}):")
-            print(f"  With preemption: {format_time(time_with)}")
-            print(f"  Without preemption: {format_time(time_without)}")
-            print(f"  Time saved: {format_time(time_saved)}")
-            print(f"  Improvement: {(time_saved/time_without*100):.1f}%")
+            logger.warning("\nAmbulance %s (%s):", ambulance_id, AMBULANCE_PRIORITIES[ambulance_id])
+            logger.warning("  With preemption: %.2f seconds", time_with)
+            logger.warning("  Without preemption: %.2f seconds", time_without)
+            logger.warning("  Time saved: %.2f seconds", time_saved)
+            logger.warning("  Improvement: %.1f%%", time_saved/time_without*100)